@@ -1,4 +1,6 @@
 import math
+import numpy as np
+from batch_workspace import prepare_out, prepare_work
 
 def Dpsi_cos_epsilonA(T, F):
     """
@@ -140,3 +142,157 @@ def Dpsi_cos_epsilonA(T, F):
     s += T*1.018108730330026e-11*math.sin(F[1]-2*F[2]-2*F[4]+3.141592653589793)
     s += T*1.01326059351893e-11*math.sin(F[0]-2*F[2]-F[4]+3.141592653589793)
     return s*math.cos(epsA)
+
+# Terms of the truncated IAU 2000A series in Dpsi_cos_epsilonA(), used by
+# Dpsi_cos_epsilonA_batch(). Each row is (m[0], ..., m[13], phase, A0, A1) and
+# the term is (A0 + A1*T)*sin(m[0]*F[0] + ... + m[13]*F[13] + phase).
+DPSI_TERMS = np.array([
+    [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141398621411859, 8.341910002468069e-05, 0],
+    [0, 0, 2, -2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.14055278673354, 6.38544187961502e-06, 0],
+    [0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.140364408833701, 1.103639471272347e-06, 0],
+    [0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.0003364578476439898, 1.005772218329172e-06, 0],
+    [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.008006593697976428, 7.155482964182905e-07, 0],
+    [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.001226166810779262, 3.44779871829835e-07, 0],
+    [0, 1, 2, -2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.140578763247785, 2.505620202702747e-07, 0],
+    [0, 0, 2, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.140611507409127, 1.877693986989801e-07, 0],
+    [1, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.138885869339794, 1.461544069750348e-07, 0],
+    [0, 1, -2, 2, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141078357595216, 1.046368658184346e-07, 0],
+    [1, 0, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.140522576672403, 7.611482188502514e-08, 0],
+    [0, 0, 2, -2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.001411558250493397, 6.216626582066176e-08, 0],
+    [1, 0, -2, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141438753852638, 5.985364333756062e-08, 0],
+    [0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.00236671010798622, 3.072709235108941e-08, 0],
+    [1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.0004278244074266593, 3.059659421492706e-08, 0],
+    [1, 0, -2, -2, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.00249810864368704, 2.891680223806012e-08, 0],
+    [1, 0, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.003259958094348328, 2.810770733076956e-08, 0],
+    [1, 0, 2, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.139093288480492, 2.50227666794999e-08, 0],
+    [2, 0, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.0003771845091653969, 2.313628013568719e-08, 0],
+    [2, 0, -2, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.140917169413882, 2.224955934316166e-08, 0],
+    [0, 0, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.13749580361748, 1.869748133639419e-08, 0],
+    [0, 2, -2, 2, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 1.574723317611884e-08, 0],
+    [2, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.137373133440903, 1.505165953603724e-08, 0],
+    [2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.002530514723072703, 1.417745186935223e-08, 0],
+    [1, 0, 2, -2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.497359492156411e-05, 1.38622775924428e-08, 0],
+    [0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.002549536717151993, 1.255041255256392e-08, 0],
+    [0, 0, 2, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.140995857994301, 1.056069829628443e-08, 0],
+    [1, 0, -2, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141103440772307, 9.910077641445381e-09, 0],
+    [0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.0005985514338772515, 8.099783621226679e-09, 0],
+    [0, 2, 2, -2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.140579611008646, 7.65715120853957e-09, 0],
+    [1, 0, 0, -2, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.1408672514485, 7.351716594611941e-09, 0],
+    [0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.13597113734224, 6.81319431374123e-09, 0],
+    [1, 0, 0, -2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.138718428614093, 6.241032296017232e-09, 0],
+    [0, 1, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.004978621738499853, 6.13490835259097e-09, 0],
+    [2, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.001269955775912256, 5.344590330395645e-09, 0],
+    [1, 0, -2, -2, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.002450014698015139, 4.947053649557188e-09, 0],
+    [0, 0, 1, -1, 1, 0, 0, -1, 0, -2, 5, 0, 0, 0, 2.112678527143739, 2.899014947660038e-09, 0],
+    [1, 0, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.135868766575786, 3.726823817267823e-09, 0],
+    [0, 1, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.001453871563522291, 3.668104187987967e-09, 0],
+    [1, 1, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.140504218645463, 3.563382666907906e-09, 0],
+    [0, 1, -2, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.001120290807057238, 3.462056669332664e-09, 0],
+    [0, 0, 2, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.137825909313233, 3.217731228665462e-09, 0],
+    [1, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.003650173902623447, 3.187671189169734e-09, 0],
+    [2, 0, 2, -2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.001086449983826601, 3.123656390929276e-09, 0],
+    [0, 0, 0, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141275294032057, 3.055295972212552e-09, 0],
+    [1, 0, 2, -2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.0003448275725395338, 2.811919517612434e-09, 0],
+    [2, 0, 0, -2, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.002597846597843798, 2.799323640768563e-09, 0],
+    [2, 0, 2, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.137667440104039, 2.593773175432264e-09, 0],
+    [0, 0, 0, 2, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.004250986539198727, 2.395001224546236e-09, 0],
+    [0, 1, -2, 2, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.0006313130474418824, 2.303835071736334e-09, 0],
+    [1, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.001269840587303581, 2.290746490151074e-09, 0],
+    [1, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.054136232211202, 1.959348266025694e-09, 0],
+    [0, 1, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.13929274964128, 2.107975460591217e-09, 0],
+    [0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.140410621043379, 2.050763303757379e-09, 0],
+    [2, 0, 0, -2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.001476013688257454, 1.970769760485542e-09, 0],
+    [1, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.001232740992911526, 1.966405784704713e-09, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 2, -5, 0, 0, -1, 1.03080425520928, 1.361663502631758e-09, 0],
+    [0, 1, 2, -2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.00139703736997594, 1.735149857948379e-09, 0],
+    [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.140117293196702, 1.643035353467799e-09, 0],
+    [1, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.003893361579551144, 1.618805150347474e-09, 0],
+    [1, -1, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141287403294024, 1.5882496933096e-09, 0],
+    [2, 0, -2, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.0006512535712295179, 1.488863130424037e-09, 0],
+    [3, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.136422068851762, 1.406463289717303e-09, 0],
+    [1, -1, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.138812952618509, 1.395299164784956e-09, 0],
+    [1, 1, -2, -2, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.002483144949499867, 1.3666939805692e-09, 0],
+    [0, 1, -2, -2, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.004155623981672819, 1.283312894781367e-09, 0],
+    [1, 1, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.002821435479844587, 1.202827530382758e-09, 0],
+    [2, 0, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.004359170295859138, 1.112173151408997e-09, 0],
+    [2, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.0009178519680427467, 1.056409456124901e-09, 0],
+    [0, 0, 0, 0, 0, 0, 0, 4, -8, 3, 0, 0, 0, 0, 1.851235548038846, 8.092555506999434e-10, 0],
+    [0, 0, 0, 0, 0, 0, 3, -5, 0, 0, 0, 0, 0, -2, 0, 1.001140251491192e-09, 0],
+    [1, 0, -2, 2, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.003019618401508975, 9.633291762249233e-10, 0],
+    [0, 1, -1, 1, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1.570796326794897, 9.638095980457573e-10, 0],
+    [1, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 9.604159022779907e-10, 0],
+    [0, 0, 1, -1, 1, 0, -8, 12, 0, 0, 0, 0, 0, 0, 0.4623133869773009, 6.500127564502446e-10, 0],
+    [0, 0, 2, 1, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.003012039083950873, 8.047943613389794e-10, 0],
+    [3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.003809505381148839, 7.635870884552009e-10, 0],
+    [1, 0, -2, -4, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.005917090706027326, 7.374145180946386e-10, 0],
+    [0, 0, 0, 0, 0, 0, 1, -1, 0, 0, 0, 0, 0, 0, 0, 7.199483164476608e-10, 0],
+    [0, 0, 0, 0, 0, 0, 0, 8, -16, 4, 5, 0, 0, 0, 0, 6.981317007977317e-10, 0],
+    [1, 0, 0, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.138745686192619, 6.811659824582501e-10, 0],
+    [2, 0, -2, -2, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.140141275799033, 6.680739562168736e-10, 0],
+    [1, 0, 0, -4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.137855750207207, 6.48685234584542e-10, 0],
+    [1, 0, 2, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.135582207560339, 6.452986653777402e-10, 0],
+    [1, -1, 0, -1, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 6.370451769779302e-10, 0],
+    [1, 1, 2, -2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6.254096486313013e-10, 0],
+    [2, 0, 0, -4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.139252564257516, 6.215328409441865e-10, 0],
+    [0, 2, -2, 2, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6.220159528635346e-10, 0],
+    [0, 0, 0, 0, 0, 0, 0, 1, 0, -1, 0, 0, 0, 0, -3.1178849131326, 5.93093800438832e-10, 0],
+    [0, 0, 2, -2, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6.050474740247008e-10, 0],
+    [2, 0, -2, -4, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.004118592857185193, 5.885688007494432e-10, 0],
+    [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.14142674108978, 0, 8.444882361015366e-08],
+    [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3.137468512115215, 0, 1.76333083538632e-09],
+    [0, 0, 2, -2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.134268565802815, 0, 7.943400401328656e-10],
+    [0, 1, 2, -2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.001629459206377831, 0, 5.950611021781352e-10],
+    [0, 1, -2, 2, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2.397888466767765e-10],
+    [0, 0, 2, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.138859673239229, 0, 1.773939884115236e-10],
+    [0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.132809392415949, 0, 1.103963334611988e-10],
+    [0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9.754451263923862e-11],
+    [0, 0, 2, -2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6.62255488395626e-11],
+    [0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 0, 4.120916289431055e-11],
+    [0, 2, 2, -2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.490658503988658e-11],
+    [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.442177135877704e-11],
+    [1, 0, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.044629917367885e-11],
+    [1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.044629917367885e-11],
+    [2, 0, -2, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 0, 2.419220268736584e-11],
+    [1, 0, 2, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 0, 2.031369323848956e-11],
+    [1, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 0, 1.706544157505567e-11],
+    [0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 0, 1.21203420277384e-11],
+    [0, 1, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 0, 1.018108730330026e-11],
+    [0, 1, -2, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 0, 1.018108730330026e-11],
+    [1, 0, -2, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3.141592653589793, 0, 1.01326059351893e-11]
+])
+DPSI_MULT = np.ascontiguousarray(DPSI_TERMS[:, :14])
+DPSI_PHASE = np.ascontiguousarray(DPSI_TERMS[:, 14:15])
+DPSI_AMP = np.ascontiguousarray(DPSI_TERMS[:, 15:].T)
+
+def Dpsi_cos_epsilonA_batch(T, F, out=None, work=None):
+    """
+    Array version of Dpsi_cos_epsilonA(). T is an array of TT Julian centuries
+    and F is an array of shape (14,) + T.shape containing the fundamental
+    arguments, e.g. computed by fundamental_arguments_batch().
+
+    Return Delta psi * cos(epsilon_A) in radians.
+    If out is given, the result is stored in it. If work (a BatchWorkspace)
+    is also given and reused, repeated calls on arrays of a fixed shape
+    allocate no new arrays.
+    """
+    shape = np.shape(T)
+    s = prepare_out(out, shape)
+    work = prepare_work(work)
+    n = s.size
+    ang = work.get('Dpsi_ang', (len(DPSI_TERMS), n))
+    sums = work.get('Dpsi_sums', (2, n))
+    epsA = work.get('Dpsi_epsA', shape)
+    np.matmul(DPSI_MULT, F.reshape(14, n), out=ang)
+    ang += DPSI_PHASE
+    np.sin(ang, out=ang)
+    np.matmul(DPSI_AMP, ang, out=sums)
+    np.multiply(sums[1].reshape(shape), T, out=s)
+    s += sums[0].reshape(shape)
+    np.multiply(T, -2.104091376015386e-13, out=epsA)
+    epsA += -2.792526803190927e-12
+    for c in (9.712757287348442e-09, -8.876938501115605e-10, -0.00022707106390167, 0.4090926006005829):
+        epsA *= T
+        epsA += c
+    np.cos(epsA, out=epsA)
+    s *= epsA
+    return s
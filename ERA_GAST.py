@@ -1,7 +1,10 @@
 import math
+import numpy as np
 
-from mod_functions import mod2pi, mod2pi_omgDf
-from Eo_Vondrak_IAU2000A_spline import Eo_Vondrak_IAU2000A_spline
+from mod_functions import mod2pi, mod2pi_omgDf, mod2pi_batch, mod2pi_omgDf_batch, split_jd_batch
+from datetime64_split import split_datetime64_batch, set_nat_to_nan
+from batch_workspace import broadcast_shape, prepare_out, prepare_work
+from Eo_Vondrak_IAU2000A_spline import Eo_Vondrak_IAU2000A_spline, Eo_Vondrak_IAU2000A_spline_datetime64
 from Eo_Vondrak_longT import Eo_Vondrak_longT
 
 def ERA_from_UT1(jd0_ut1, jd1_ut1):
@@ -15,6 +18,58 @@ def ERA_from_UT1(jd0_ut1, jd1_ut1):
     ERA = mod2pi_omgDf(0.01720217957524373, D0, 0) + fday*6.300387486754831 - 1.38822409435583
     return mod2pi(ERA)
 
+def ERA_from_UT1_batch(jd0_ut1, jd1_ut1, out=None, work=None):
+    """
+    Array version of ERA_from_UT1(). jd0_ut1 and jd1_ut1 are broadcast against
+    each other like the arguments of a NumPy ufunc.
+    Return ERA in radian in the range [-pi, pi).
+    If out is given, the result is stored in it. If work (a BatchWorkspace)
+    is also given and reused, repeated calls on arrays of a fixed shape
+    allocate no new arrays.
+    """
+    shape = broadcast_shape(jd0_ut1, jd1_ut1)
+    work = prepare_work(work)
+    jd_int = work.get('ERA_jd_int', shape)
+    fday = work.get('ERA_fday', shape)
+    split_jd_batch(jd0_ut1, jd1_ut1, jd_int, fday, work, jd_offset=2451545)
+    return ERA_from_UT1_split(jd_int, fday, out, work)
+
+def ERA_from_UT1_datetime64(t_ut1, out=None, work=None):
+    """
+    Calculate ERA at the UT1 times t_ut1, given as a datetime64 array or an
+    integer array of nanoseconds since 1970-01-01T00:00:00 UT1. No time scale
+    conversion is done: the times must already be in UT1.
+    The Julian date is split into its integer and fractional parts with
+    integer arithmetic, see split_datetime64_batch().
+    Return ERA in radian in the range [-pi, pi), or NaN where t_ut1 is NaT.
+    out and work are as in ERA_from_UT1_batch().
+    """
+    shape = np.shape(t_ut1)
+    work = prepare_work(work)
+    jd_int = work.get('ERA_jd_int', shape)
+    fday = work.get('ERA_fday', shape)
+    jd_int, fday, nat = split_datetime64_batch(t_ut1, jd_int, fday, work)
+    ERA = ERA_from_UT1_split(jd_int, fday, out, work)
+    return set_nat_to_nan(ERA, nat)
+
+def ERA_from_UT1_split(jd_int, fday, out=None, work=None):
+    """
+    Array version of ERA_from_UT1() at UT1 JD = jd_int + fday, where jd_int
+    is an integer and fday is in [0, 1).
+    Return ERA in radian in the range [-pi, pi).
+    """
+    shape = broadcast_shape(jd_int, fday)
+    ERA = prepare_out(out, shape)
+    work = prepare_work(work)
+    D0 = work.get('ERA_D0', shape)
+    tmp = work.get('ERA_tmp', shape)
+    np.subtract(jd_int, 2451545, out=D0)
+    mod2pi_omgDf_batch(0.01720217957524373, D0, 0, ERA, work)
+    np.multiply(fday, 6.300387486754831, out=tmp)
+    ERA += tmp
+    ERA -= 1.38822409435583
+    return mod2pi_batch(ERA, ERA, work)
+
 def GAST_from_Eo(jd0_ut1, jd1_ut1, Eo):
     """
     Calculate GAST at UT1 jd_ut1 = jd0_ut1 + jd1_ut1 from ERA and Eo.
@@ -41,3 +96,19 @@ def GAST_Vondrak_longT(jd0_ut1, jd1_ut1, jd0_tt, jd1_tt):
     """
     Eo = Eo_Vondrak_longT(jd0_tt, jd1_tt)
     return GAST_from_Eo(jd0_ut1, jd1_ut1, Eo)
+
+def GAST_Vondrak_IAU2000A_spline_datetime64(t_ut1, t_tt, out=None, work=None):
+    """
+    Calculate GAST at the UT1 times t_ut1 from ERA and Eo calculated by the spline formula at the TT times t_tt.
+    t_ut1 and t_tt are datetime64 arrays or integer arrays of nanoseconds since 1970-01-01T00:00:00 in UT1 and TT,
+    respectively (e.g. t_tt = t_ut1 + (TT - UT1) as timedelta64). t_ut1 and t_tt are broadcast against each
+    other like the arguments of a NumPy ufunc.
+    Return GAST in radian in the range [-pi, pi), or NaN where t_ut1 or t_tt is NaT.
+    out and work are as in ERA_from_UT1_batch().
+    """
+    shape = broadcast_shape(t_ut1, t_tt)
+    work = prepare_work(work)
+    GAST = ERA_from_UT1_datetime64(np.broadcast_to(t_ut1, shape), out, work)
+    Eo = Eo_Vondrak_IAU2000A_spline_datetime64(np.broadcast_to(t_tt, shape), work.get('GAST_Eo', shape), work)
+    GAST -= Eo
+    return mod2pi_batch(GAST, GAST, work)
@@ -1,6 +1,10 @@
 import numpy as np
-from fundamental_arguments import fundamental_arguments
-from Dpsi_cos_epsilonA import Dpsi_cos_epsilonA
+from fundamental_arguments import fundamental_arguments, fundamental_arguments_batch
+from Dpsi_cos_epsilonA import Dpsi_cos_epsilonA, Dpsi_cos_epsilonA_batch
+from mod_functions import split_jd_batch
+from datetime64_split import split_datetime64_batch, set_nat_to_nan
+from batch_workspace import broadcast_shape, prepare_out, prepare_work
+from spline_segments import spline_segment_batch
 
 def Eo_Vondrak_IAU2000A_spline(jd0, jd1):
     """
@@ -82,3 +86,100 @@ def set_Eop_coefficients(T):
         T0 = 50
         cpoly = np.array([-1.134049896561772, -0.02296751467215479, -4.684438743393382e-06, 2.807675328930574e-08, 1.332196864951549e-10])
     return T0, cpoly, csin, ph
+
+# Coefficients of all sub-intervals of the spline formula, arranged for
+# Eop_Vondrak_IAU2000A_spline_batch(). The sub-intervals are numbered as in
+# spline_segment_batch().
+def Eop_coefficient_tables():
+    segs = [set_Eop_coefficients(T) for T in (-50, -30, -12.5, 0, 12.5, 30, 50)]
+    T0 = np.array([seg[0] for seg in segs], dtype=float)
+    cpoly = np.array([seg[1] for seg in segs]).T.copy()
+    return T0, cpoly, segs[0][2], segs[0][3]
+
+EOP_T0, EOP_CPOLY, EOP_CSIN, EOP_PH = Eop_coefficient_tables()
+def Eo_Vondrak_IAU2000A_spline_batch(jd0, jd1, out=None, work=None):
+    """
+    Array version of Eo_Vondrak_IAU2000A_spline(). jd0 and jd1 are broadcast
+    against each other like the arguments of a NumPy ufunc.
+
+    JD must be in the range so that |T| = |(jd-2451545)/36525| <= 60 for all elements.
+
+    Eo is returned in radians.
+    If out is given, the result is stored in it. If work (a BatchWorkspace)
+    is also given and reused, repeated calls on arrays of a fixed shape
+    allocate no new arrays.
+    """
+    shape = broadcast_shape(jd0, jd1)
+    work = prepare_work(work)
+    jd_int = work.get('Eo_jd_int', shape)
+    fday = work.get('Eo_fday', shape)
+    split_jd_batch(jd0, jd1, jd_int, fday, work)
+    return Eo_Vondrak_IAU2000A_spline_split(jd_int, fday, out, work)
+
+def Eo_Vondrak_IAU2000A_spline_datetime64(t_tt, out=None, work=None):
+    """
+    Calculate Eo by the spline formula at the TT times t_tt, given as a
+    datetime64 array or an integer array of nanoseconds since
+    1970-01-01T00:00:00 TT. No time scale conversion is done: the times must
+    already be in TT.
+
+    The Julian date is split into its integer and fractional parts with
+    integer arithmetic. This is exact, whereas converting the times to
+    floating point (jd0, jd1) pairs first loses precision.
+
+    Eo is returned in radians, and is NaN where t_tt is NaT.
+    out and work are as in Eo_Vondrak_IAU2000A_spline_batch().
+    """
+    shape = np.shape(t_tt)
+    work = prepare_work(work)
+    jd_int = work.get('Eo_jd_int', shape)
+    fday = work.get('Eo_fday', shape)
+    jd_int, fday, nat = split_datetime64_batch(t_tt, jd_int, fday, work)
+    Eo = Eo_Vondrak_IAU2000A_spline_split(jd_int, fday, out, work)
+    return set_nat_to_nan(Eo, nat)
+
+def Eo_Vondrak_IAU2000A_spline_split(jd_int, fday, out=None, work=None):
+    """
+    Array version of Eo_Vondrak_IAU2000A_spline() at TT JD = jd_int + fday,
+    where jd_int is an integer and fday is in [0, 1).
+    """
+    shape = broadcast_shape(jd_int, fday)
+    Eo = prepare_out(out, shape)
+    work = prepare_work(work)
+    T = work.get('Eo_T', shape)
+    np.subtract(jd_int, 2451545, out=T)
+    T += fday
+    T /= 36525.0
+    np.absolute(T, out=Eo)
+    if Eo.size > 0 and Eo.max() > 60:
+        raise RuntimeError('Requested time is out of range.')
+
+    F = fundamental_arguments_batch(jd_int, fday, work.get('Eo_F', (14,) + shape), work)
+    Eop_Vondrak_IAU2000A_spline_batch(T, F[4], Eo, work)
+    Dpsi = Dpsi_cos_epsilonA_batch(T, F, work.get('Eo_Dpsi', shape), work)
+    Eo -= Dpsi
+    return Eo
+
+def Eop_Vondrak_IAU2000A_spline_batch(T, Omg, out, work):
+    """
+    Array version of Eop_Vondrak_IAU2000A_spline(). The result is stored in out.
+    """
+    shape = T.shape
+    iseg = spline_segment_batch(T, work.get('Eop_iseg', shape, np.intp), work)
+    Tp = work.get('Eop_Tp', shape)
+    c = work.get('Eop_c', (5,) + shape)
+    tmp = work.get('Eop_tmp', shape)
+    np.take(EOP_T0, iseg, out=Tp, mode='clip')
+    np.subtract(T, Tp, out=Tp)
+    np.take(EOP_CPOLY, iseg, axis=1, out=c, mode='clip')
+    np.multiply(Tp, c[4], out=out)
+    for i in (3, 2, 1, 0):
+        out += c[i]
+        if i > 0: out *= Tp
+    for i in range(2):
+        np.multiply(Omg, i+1, out=tmp)
+        tmp += EOP_PH[i]
+        np.sin(tmp, out=tmp)
+        tmp *= EOP_CSIN[i]
+        out += tmp
+    return out
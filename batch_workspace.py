@@ -0,0 +1,52 @@
+import numpy as np
+
+class BatchWorkspace:
+    """
+    Reusable scratch arrays for the batch (array) functions.
+
+    Pass the same BatchWorkspace as work= to repeated calls of a batch function
+    on arrays of a fixed shape. The scratch arrays are allocated on the first
+    call and reused afterwards, so that together with out= the calls allocate
+    no new arrays after warm-up. A workspace may be shared between different
+    batch functions, but not between threads.
+    """
+    def __init__(self):
+        self.buffers = {}
+
+    def get(self, name, shape, dtype=float):
+        """
+        Return the scratch array called name with the given shape and dtype.
+        A new array is allocated only if the cached one does not match.
+        """
+        buf = self.buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self.buffers[name] = buf
+        return buf
+
+def broadcast_shape(*args):
+    """
+    Return the shape obtained by broadcasting the arguments against each other
+    as a NumPy ufunc would.
+    """
+    return np.broadcast_shapes(*[np.shape(a) for a in args])
+
+def prepare_out(out, shape, name='out'):
+    """
+    Return out if it is a float64 array of the given shape, or a new array if
+    out is None. Lower precision output would lose the accuracy preserved by
+    the reduction of the phases, so other dtypes are rejected.
+    """
+    if out is None:
+        return np.empty(shape)
+    if out.dtype != np.float64:
+        raise TypeError('%s must have dtype float64, not %s' % (name, out.dtype))
+    if out.shape != shape:
+        raise ValueError('%s has shape %s, expected %s' % (name, out.shape, shape))
+    return out
+
+def prepare_work(work):
+    """
+    Return work, or a new (single use) BatchWorkspace if work is None.
+    """
+    return BatchWorkspace() if work is None else work
@@ -0,0 +1,51 @@
+"""
+Benchmark of the batch functions called with and without reused output
+buffers (out=) and workspace (work=).
+
+Usage: python benchmark_batch.py [n1 n2 ...]
+where n1, n2, ... are the array sizes (default: 10 1000 100000).
+"""
+import sys
+import timeit
+import numpy as np
+
+from batch_workspace import BatchWorkspace
+from ERA_GAST import ERA_from_UT1_batch
+from Eo_Vondrak_IAU2000A_spline import Eo_Vondrak_IAU2000A_spline_batch
+from s_Vondrak_IAU2000A_spline import s_Vondrak_IAU2000A_spline_batch
+from fundamental_arguments import fundamental_arguments_batch
+
+def time_per_call(f, ncalls=None):
+    """
+    Return the best time per call of f() in seconds.
+    """
+    if ncalls is None:
+        ncalls, _ = timeit.Timer(f).autorange()
+    return min(timeit.repeat(f, number=ncalls, repeat=5))/ncalls
+
+def benchmark(n):
+    rng = np.random.default_rng(0)
+    jd0 = 2451545.0 + rng.integers(-2190000, 2190000, n).astype(float) - 0.5
+    jd1 = rng.uniform(0, 1, n)
+    jd_int = np.floor(jd0 + jd1)
+    fday = (jd0 + jd1) - jd_int
+    cases = [
+        ('ERA_from_UT1_batch', ERA_from_UT1_batch, (jd0, jd1), (n,)),
+        ('Eo_Vondrak_IAU2000A_spline_batch', Eo_Vondrak_IAU2000A_spline_batch, (jd0, jd1), (n,)),
+        ('s_Vondrak_IAU2000A_spline_batch', s_Vondrak_IAU2000A_spline_batch, (jd0, jd1), (n,)),
+        ('fundamental_arguments_batch', fundamental_arguments_batch, (jd_int, fday), (14, n)),
+    ]
+    print('n = %d' % n)
+    print('%-34s %14s %14s %8s' % ('function', 'no buffers', 'buffers', 'ratio'))
+    for name, f, args, shape in cases:
+        out = np.empty(shape)
+        work = BatchWorkspace()
+        t0 = time_per_call(lambda: f(*args))
+        t1 = time_per_call(lambda: f(*args, out=out, work=work))
+        print('%-34s %11.1f us %11.1f us %8.2f' % (name, t0*1e6, t1*1e6, t0/t1))
+    print()
+
+if __name__ == '__main__':
+    sizes = [int(a) for a in sys.argv[1:]] or [10, 1000, 100000]
+    for n in sizes:
+        benchmark(n)
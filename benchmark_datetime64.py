@@ -0,0 +1,73 @@
+"""
+Benchmark of the datetime64 entry points against converting the times to
+two-part Julian dates (jd0, jd1) first and then calling the batch functions.
+
+Usage: python benchmark_datetime64.py [n1 n2 ...]
+where n1, n2, ... are the array sizes (default: 1000 100000).
+"""
+import sys
+import timeit
+import numpy as np
+
+from batch_workspace import BatchWorkspace
+from ERA_GAST import ERA_from_UT1_batch, ERA_from_UT1_datetime64, GAST_Vondrak_IAU2000A_spline_datetime64
+from Eo_Vondrak_IAU2000A_spline import Eo_Vondrak_IAU2000A_spline_batch, Eo_Vondrak_IAU2000A_spline_datetime64
+from s_Vondrak_IAU2000A_spline import s_Vondrak_IAU2000A_spline_batch, s_Vondrak_IAU2000A_spline_datetime64
+from mod_functions import mod2pi_batch
+
+UNIX_EPOCH = np.datetime64('1970-01-01T00:00:00', 'ns')
+
+def time_per_call(f):
+    """
+    Return the best time per call of f() in seconds.
+    """
+    ncalls, _ = timeit.Timer(f).autorange()
+    return min(timeit.repeat(f, number=ncalls, repeat=3))/ncalls
+
+def to_jd(t):
+    """
+    The convert-then-call path: convert datetime64 times to (jd0, jd1) with
+    jd0 = JD of 1970-01-01T00:00:00 and jd1 the floating point days since then.
+    """
+    return 2440587.5, (t - UNIX_EPOCH)/np.timedelta64(1, 'D')
+
+def GAST_from_jd(jd_ut1, jd_tt, out, work):
+    """
+    GAST by the convert-then-call path.
+    """
+    GAST = ERA_from_UT1_batch(*jd_ut1, out=out, work=work)
+    GAST -= Eo_Vondrak_IAU2000A_spline_batch(*jd_tt, out=work.get('bench_Eo', GAST.shape), work=work)
+    return mod2pi_batch(GAST, GAST, work)
+
+def benchmark(n):
+    rng = np.random.default_rng(0)
+    # UT1 times in 1700-2250, TT = UT1 + 69 s
+    t_ut1 = rng.integers(-8.5e18, 8.5e18, n).astype('datetime64[ns]')
+    t_tt = t_ut1 + np.timedelta64(69, 's')
+    cases = [
+        ('ERA', lambda out, work: ERA_from_UT1_datetime64(t_ut1, out, work),
+                lambda out, work: ERA_from_UT1_batch(*to_jd(t_ut1), out=out, work=work)),
+        ('Eo', lambda out, work: Eo_Vondrak_IAU2000A_spline_datetime64(t_tt, out, work),
+               lambda out, work: Eo_Vondrak_IAU2000A_spline_batch(*to_jd(t_tt), out=out, work=work)),
+        ('s', lambda out, work: s_Vondrak_IAU2000A_spline_datetime64(t_tt, out, work),
+              lambda out, work: s_Vondrak_IAU2000A_spline_batch(*to_jd(t_tt), out=out, work=work)),
+        ('GAST', lambda out, work: GAST_Vondrak_IAU2000A_spline_datetime64(t_ut1, t_tt, out, work),
+                 lambda out, work: GAST_from_jd(to_jd(t_ut1), to_jd(t_tt), out, work)),
+    ]
+    print('n = %d' % n)
+    print('%-6s %14s %16s %8s %18s' % ('', 'datetime64', 'convert + call', 'ratio', 'max difference'))
+    for name, direct, convert in cases:
+        out = np.empty(n)
+        work = BatchWorkspace()
+        t0 = time_per_call(lambda: direct(out, work))
+        t1 = time_per_call(lambda: convert(out, work))
+        x0 = direct(np.empty(n), work)
+        x1 = convert(np.empty(n), work)
+        diff = np.abs((x0 - x1 + np.pi) % (2*np.pi) - np.pi).max()
+        print('%-6s %11.1f us %13.1f us %8.2f %14.2e rad' % (name, t0*1e6, t1*1e6, t1/t0, diff))
+    print()
+
+if __name__ == '__main__':
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 100000]
+    for n in sizes:
+        benchmark(n)
@@ -0,0 +1,77 @@
+import math
+import numpy as np
+
+INT64_MAX = np.iinfo(np.int64).max
+# NaT is stored as the smallest int64, for any datetime64 unit
+NAT_TICKS = np.iinfo(np.int64).min
+
+def datetime64_ticks(t):
+    """
+    Return (ticks, ticks_per_day) for a datetime64 array t or an integer array
+    of nanoseconds since 1970-01-01T00:00:00, where ticks is an int64 array of
+    the time elapsed since 1970-01-01T00:00:00 in units of 1/ticks_per_day day.
+    No copy is made for integer input or datetime64 input with a unit between
+    days and nanoseconds that divides a day.
+    """
+    t = np.asarray(t)
+    if t.dtype.kind in 'iu':
+        if t.dtype.kind == 'u' and t.itemsize >= 8 and t.size > 0 and t.max() > INT64_MAX:
+            raise ValueError('Integer nanoseconds must be less than 2**63.')
+        return t.astype(np.int64, copy=False), 86400000000000
+    if t.dtype.kind != 'M':
+        raise TypeError('Times must be datetime64 or integer nanoseconds, not %s.' % t.dtype)
+    unit, count = np.datetime_data(t.dtype)
+    if unit in ('Y', 'M', 'W'):
+        t = t.astype('datetime64[D]')
+        unit, count = 'D', 1
+    elif unit in ('ps', 'fs', 'as'):
+        t = t.astype('datetime64[ns]')
+        unit, count = 'ns', 1
+    tpd = np.timedelta64(1, 'D') / np.timedelta64(count, unit)
+    if tpd != math.floor(tpd):
+        # units that do not divide a day, e.g. 7h
+        t = t.astype('datetime64[ns]')
+        tpd = 86400000000000
+    return t.view(np.int64), int(tpd)
+
+def split_datetime64_batch(t, jd_int, fday, work):
+    """
+    Split the times t (see datetime64_ticks()) into the Julian date
+    jd = jd_int + fday, where jd_int is an integer and fday is in [0, 1).
+    The split is done with integer arithmetic, so jd_int is exact and fday is
+    the correctly rounded fraction of the day since the preceding noon.
+    The results are stored in jd_int and fday.
+
+    Return (jd_int, fday, nat), where the boolean array nat marks the
+    elements of t that are NaT (or the smallest int64 for integer input).
+    For these elements jd_int + fday is set to J2000, and the caller should
+    replace the corresponding results by NaN, see set_nat_to_nan().
+    """
+    ticks, tpd = datetime64_ticks(t)
+    nat = work.get('dt64_nat', fday.shape, bool)
+    np.equal(ticks, NAT_TICKS, out=nat)
+    # 1970-01-01T00:00:00 is JD 2440587.5. Count ticks from JD 2440587.0 in
+    # units of half a tick, so that the half day offset is an integer even
+    # when t is in units of days.
+    d = work.get('dt64_d', fday.shape, np.int64)
+    r = work.get('dt64_r', fday.shape, np.int64)
+    c = work.get('dt64_c', fday.shape, np.int64)
+    np.divmod(ticks, tpd, out=(d, r))
+    r *= 2
+    r += tpd
+    np.floor_divide(r, 2*tpd, out=c)
+    d += c
+    np.multiply(c, 2*tpd, out=c)
+    r -= c
+    np.add(d, 2440587, out=jd_int)
+    np.divide(r, 2*tpd, out=fday)
+    np.copyto(jd_int, 2451545.0, where=nat)
+    np.copyto(fday, 0.0, where=nat)
+    return jd_int, fday, nat
+
+def set_nat_to_nan(x, nat):
+    """
+    Set the elements of x marked by nat (from split_datetime64_batch()) to NaN.
+    """
+    np.copyto(x, np.nan, where=nat)
+    return x
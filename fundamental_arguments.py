@@ -1,4 +1,26 @@
-from mod_functions import mod2pi, mod2pi_omgDf
+import numpy as np
+from mod_functions import mod2pi, mod2pi_omgDf, mod2pi_batch, mod2pi_omgDf_batch
+from batch_workspace import broadcast_shape, prepare_out, prepare_work
+
+# Coefficients of the fundamental arguments, used by both the scalar and the
+# batch functions:
+# F[i] = mod2pi(phase + sign*mod2pi_omgDf(rate/36525, D0, fday) + c2*T^2 + c3*T^3 + c4*T^4)
+# for i = 0, 1, ..., 12. Each row is (phase, sign, rate, c2, c3, c4).
+FA_COEFFS = [
+    (2.355555743493879, 1, 8328.691425719086, 0.0001545547230282712, 2.503335442409089e-07, -1.186339077675034e-09),
+    (-0.04312518026630256, 1, 628.3019551713968, -2.681989283897953e-06, 6.593466063089689e-10, -5.570509195948569e-11),
+    (1.627905081537519, 1, 8433.466156916373, -6.181956210563916e-05, -5.027517873105888e-09, 2.021673050226765e-11),
+    (-1.084718718519387, 1, 7771.377145593714, -3.08855403687641e-05, 3.196376599555171e-08, -1.53637455543612e-10),
+    (2.182439196615671, -1, 33.75704595363087, 3.622624787986675e-05, 3.734034971905646e-08, -2.879308452109534e-10),
+    (-1.880576465179586, 1, 2608.7903141574, 0, 0, 0),
+    (-3.107038610179586, 1, 1021.3285546211, 0, 0, 0),
+    (1.753470314, 1, 628.3075849991, 0, 0, 0),
+    (-0.0797043941795863, 1, 334.06124267, 0, 0, 0),
+    (0.599546497, 1, 52.9690962641, 0, 0, 0),
+    (0.874016757, 1, 21.329910496, 0, 0, 0),
+    (-0.8018914351795861, 1, 7.4781598567, 0, 0, 0),
+    (-0.9712990201795861, 1, 3.8133035638, 0, 0, 0)
+]
 
 def fundamental_arguments(jd_int, fday):
     """
@@ -11,19 +33,8 @@ def fundamental_arguments(jd_int, fday):
     D0 = jd_int - 2451545
     T = D0/36525 + fday/36525; T2 = T*T; T3 = T*T2; T4 = T2*T2;
     F = [0]*14
-    F[0] = mod2pi(2.355555743493879 + mod2pi_omgDf(8328.691425719086/36525, D0, fday) + 0.0001545547230282712*T2 + 2.503335442409089e-07*T3 - 1.186339077675034e-09*T4)
-    F[1] = mod2pi(-0.04312518026630256+mod2pi_omgDf(628.3019551713968/36525, D0, fday)-2.681989283897953e-06*T2 + 6.593466063089689e-10*T3 - 5.570509195948569e-11*T4)
-    F[2] = mod2pi(1.627905081537519 + mod2pi_omgDf(8433.466156916373/36525, D0, fday) - 6.181956210563916e-05*T2 - 5.027517873105888e-09*T3 + 2.021673050226765e-11*T4)
-    F[3] = mod2pi(-1.084718718519387 + mod2pi_omgDf(7771.377145593714/36525, D0, fday) - 3.08855403687641e-05*T2 + 3.196376599555171e-08*T3 - 1.53637455543612e-10*T4)
-    F[4] = mod2pi( 2.182439196615671 - mod2pi_omgDf(33.75704595363087/36525, D0, fday) + 3.622624787986675e-05*T2 + 3.734034971905646e-08*T3 - 2.879308452109534e-10*T4)
-    F[5] = mod2pi(-1.880576465179586 + mod2pi_omgDf(2608.7903141574/36525, D0, fday))
-    F[6] = mod2pi(-3.107038610179586 + mod2pi_omgDf(1021.3285546211/36525, D0, fday))
-    F[7] = mod2pi(1.753470314 + mod2pi_omgDf(628.3075849991/36525, D0, fday))
-    F[8] = mod2pi(-0.0797043941795863 + mod2pi_omgDf(334.06124267/36525, D0, fday))
-    F[9] = mod2pi(0.599546497 + mod2pi_omgDf(52.9690962641/36525, D0, fday))
-    F[10] = mod2pi(0.874016757 + mod2pi_omgDf(21.329910496/36525, D0, fday))
-    F[11] = mod2pi(-0.8018914351795861 + mod2pi_omgDf(7.4781598567/36525, D0, fday))
-    F[12] = mod2pi(-0.9712990201795861 + mod2pi_omgDf(3.8133035638/36525, D0, fday))
+    for i, (phase, sign, rate, c2, c3, c4) in enumerate(FA_COEFFS):
+        F[i] = mod2pi(phase + sign*mod2pi_omgDf(rate/36525, D0, fday) + c2*T2 + c3*T3 + c4*T4)
     F[13] = 0.02438175*T + 5.38691e-6*T2
     return F
 
@@ -37,9 +48,52 @@ def f_angles(jd_int, fday):
     D0 = jd_int - 2451545
     T = D0/36525 + fday/36525; T2 = T*T; T3 = T*T2; T4 = T2*T2;
     F = [0]*5
-    F[0] = mod2pi(2.355555743493879 + mod2pi_omgDf(8328.691425719086/36525, D0, fday) + 0.0001545547230282712*T2 + 2.503335442409089e-07*T3 - 1.186339077675034e-09*T4)
-    F[1] = mod2pi(-0.04312518026630256+mod2pi_omgDf(628.3019551713968/36525, D0, fday)-2.681989283897953e-06*T2 + 6.593466063089689e-10*T3 - 5.570509195948569e-11*T4)
-    F[2] = mod2pi(1.627905081537519 + mod2pi_omgDf(8433.466156916373/36525, D0, fday) - 6.181956210563916e-05*T2 - 5.027517873105888e-09*T3 + 2.021673050226765e-11*T4)
-    F[3] = mod2pi(-1.084718718519387 + mod2pi_omgDf(7771.377145593714/36525, D0, fday) - 3.08855403687641e-05*T2 + 3.196376599555171e-08*T3 - 1.53637455543612e-10*T4)
-    F[4] = mod2pi( 2.182439196615671 - mod2pi_omgDf(33.75704595363087/36525, D0, fday) + 3.622624787986675e-05*T2 + 3.734034971905646e-08*T3 - 2.879308452109534e-10*T4)
-    return F
\ No newline at end of file
+    for i, (phase, sign, rate, c2, c3, c4) in enumerate(FA_COEFFS[:5]):
+        F[i] = mod2pi(phase + sign*mod2pi_omgDf(rate/36525, D0, fday) + c2*T2 + c3*T3 + c4*T4)
+    return F
+
+def fundamental_arguments_batch(jd_int, fday, out=None, work=None, n=14):
+    """
+    Array version of fundamental_arguments(). jd_int and fday are broadcast
+    against each other like the arguments of a NumPy ufunc; jd_int must
+    contain integers.
+    Return an array of shape (n,) + broadcast shape, where F[i] is the i-th
+    fundamental argument in radians. n = 14 gives all the arguments as in
+    fundamental_arguments(); n = 5 gives the reduced set of f_angles().
+    If out is given, the result is stored in it. If work (a BatchWorkspace)
+    is also given and reused, repeated calls on arrays of a fixed shape
+    allocate no new arrays.
+    """
+    if n not in (5, 14):
+        raise ValueError('n must be 5 or 14, not %s' % n)
+    shape = broadcast_shape(jd_int, fday)
+    F = prepare_out(out, (n,) + shape)
+    work = prepare_work(work)
+    D0 = work.get('fa_D0', shape)
+    T = work.get('fa_T', shape)
+    T2 = work.get('fa_T2', shape)
+    T3 = work.get('fa_T3', shape)
+    T4 = work.get('fa_T4', shape)
+    tmp = work.get('fa_tmp', shape)
+    np.subtract(jd_int, 2451545, out=D0)
+    np.divide(D0, 36525, out=T)
+    np.divide(fday, 36525, out=tmp)
+    T += tmp
+    np.multiply(T, T, out=T2)
+    np.multiply(T, T2, out=T3)
+    np.multiply(T2, T2, out=T4)
+    for i, (phase, sign, rate, c2, c3, c4) in enumerate(FA_COEFFS[:min(n, 13)]):
+        Fi = F[i, ...]
+        mod2pi_omgDf_batch(rate/36525, D0, fday, Fi, work)
+        if sign < 0: np.negative(Fi, out=Fi)
+        Fi += phase
+        if c2 != 0:
+            np.multiply(T2, c2, out=tmp); Fi += tmp
+            np.multiply(T3, c3, out=tmp); Fi += tmp
+            np.multiply(T4, c4, out=tmp); Fi += tmp
+        mod2pi_batch(Fi, Fi, work)
+    if n > 13:
+        np.multiply(T, 0.02438175, out=F[13, ...])
+        np.multiply(T2, 5.38691e-6, out=tmp)
+        F[13, ...] += tmp
+    return F
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 # restrict x to the range [-pi, pi) by subtracting integer multiples of 2 pi.
 def mod2pi(x): 
@@ -28,4 +29,85 @@ def mod2pi_omgDf(omg, D, f):
     x += omg1*rD
     omg1 *= (k-p+0.5)
     ph = omg1*qD
-  return mod2pi(x + ph)
\ No newline at end of file
+  return mod2pi(x + ph)
+
+def mod2pi_batch(x, out, work):
+  """
+  Array version of mod2pi(). Restrict x to the range [-pi, pi) and store the
+  result in out (which may be x itself). work is a BatchWorkspace.
+  """
+  n = work.get('mod2pi_n', out.shape)
+  # same operations in the same order as mod2pi(), so that values at the
+  # boundaries are rounded identically
+  np.multiply(x, 0.5, out=n)
+  n /= math.pi
+  n += 0.5
+  np.floor(n, out=n)
+  n *= 2*math.pi
+  np.subtract(x, n, out=out)
+  return out
+
+def split_jd_batch(jd0, jd1, jd_int, fday, work, jd_offset=0):
+  """
+  Array version of the two-part Julian date split used throughout the package:
+  jd_int = floor(jd0 + jd1) and fday = jd0 + jd1 - jd_int in [0, 1), with fday
+  computed from the fractional parts of jd0 and jd1 to preserve precision.
+  If jd_offset is given, jd_int is computed as floor(jd0 - jd_offset + jd1) + jd_offset
+  (as in ERA_from_UT1() with jd_offset = 2451545).
+  The results are stored in jd_int and fday.
+  """
+  tmp = work.get('split_jd_tmp', fday.shape)
+  np.subtract(jd0, jd_offset, out=jd_int)
+  jd_int += jd1
+  np.floor(jd_int, out=jd_int)
+  if jd_offset != 0: jd_int += jd_offset
+  np.floor(jd0, out=tmp)
+  np.subtract(jd0, tmp, out=fday)
+  np.floor(jd1, out=tmp)
+  np.subtract(jd1, tmp, out=tmp)
+  fday += tmp
+  np.floor(fday, out=tmp)
+  fday -= tmp
+  return jd_int, fday
+
+def mod2pi_omgDf_batch(omg, D, f, out, work):
+  """
+  Array version of mod2pi_omgDf(). Calculate mod(omg*(D + f), 2*pi) for arrays
+  D (integer valued) and f, and store the result in out. omg is a number.
+  Each element goes through the same reduction steps as in mod2pi_omgDf(), so
+  the results are identical to the scalar function.
+  """
+  tpi = 2*math.pi
+  shape = out.shape
+  x = work.get('omgDf_x', shape)
+  qD = work.get('omgDf_qD', shape)
+  q = work.get('omgDf_q', shape)
+  ph = work.get('omgDf_ph', shape)
+  done = work.get('omgDf_done', shape, bool)
+  np.multiply(f, omg, out=x)
+  np.copyto(qD, D)
+  omg1 = omg
+  while True:
+    np.multiply(qD, omg1, out=ph)
+    np.absolute(ph, out=q)
+    np.greater(q, tpi, out=done)
+    np.logical_not(done, out=done)
+    # Elements whose reduction is complete add their last phase to x and
+    # take no further part in the reduction (their qD is set to 0). As in
+    # mod2pi_omgDf(), NaN counts as complete, so it propagates to the result.
+    np.add(x, ph, out=x, where=done)
+    if done.all(): break
+    np.copyto(qD, 0.0, where=done)
+    p = abs(tpi/omg1) + 0.5
+    k = math.floor(p)
+    # q, rD = quotient_remainder(qD, k); rD is stored in ph
+    np.divide(qD, k, out=q)
+    q += 0.5
+    np.floor(q, out=q)
+    np.multiply(q, k, out=ph)
+    np.subtract(qD, ph, out=ph)
+    ph *= omg1
+    x += ph
+    omg1 *= (k-p+0.5)
+    qD, q = q, qD
+  return mod2pi_batch(x, out, work)
@@ -1,5 +1,9 @@
 import numpy as np
-from fundamental_arguments import f_angles
+from fundamental_arguments import f_angles, fundamental_arguments_batch
+from mod_functions import split_jd_batch
+from datetime64_split import split_datetime64_batch, set_nat_to_nan
+from batch_workspace import broadcast_shape, prepare_out, prepare_work
+from spline_segments import spline_segment_batch
 
 def s_Vondrak_IAU2000A_spline(jd0, jd1):
     """
@@ -117,4 +121,125 @@ def set_s_coefficients(T):
         csin1 = np.array([-1.60628097440109e-07, -1.1479467085067e-08, -1.97067086925752e-09, 1.77177665510542e-09, -4.04656296426215e-10, -3.42379523477714e-10, -2.87174970425271e-10, 4.13093183039797e-09, 2.75556752921065e-09, 1.34290454661637e-10, 1.96253967980775e-11])
         csin2 = np.array([-1.11148847458481e-09, -7.0119014871438e-11, -1.20951996652741e-11, 7.36542750692248e-12, -5.67973588549309e-12, -9.04759381643776e-13, -4.96060462049991e-12, -1.26045409597578e-10, -9.68260999399793e-11, 1.84219132368757e-12, 8.79476573312203e-13])
 
-    return T0, cpoly, ccos0, ccos1, ccos2, csin0, csin1, csin2
\ No newline at end of file
+    return T0, cpoly, ccos0, ccos1, ccos2, csin0, csin1, csin2
+
+# Coefficients of all sub-intervals of the spline formula, arranged for
+# s_Vondrak_IAU2000A_spline_batch(). The sub-intervals are numbered as in
+# spline_segment_batch().
+def s_coefficient_tables():
+    segs = [set_s_coefficients(T) for T in (-50, -30, -12.5, 0, 12.5, 30, 50)]
+    T0 = np.array([seg[0] for seg in segs], dtype=float)
+    tables = [np.array([seg[j] for seg in segs]).T.copy() for j in range(1, 8)]
+    return T0, tables
+
+S_T0, S_TABLES = s_coefficient_tables()
+
+# Multipliers of (F[0], ..., F[4]) in the arguments angs in s_Vondrak_IAU2000A_spline()
+S_ARG_MULT = np.array([
+    [0, 0, 0, 0, 1],
+    [0, 0, 2, -2, 2],
+    [0, 0, 2, 0, 2],
+    [0, 0, 0, 0, 2],
+    [0, 1, 2, -2, 2],
+    [0, 0, 2, 0, 1],
+    [1, 0, 2, 0, 2],
+    [0, 1, -2, 2, -2],
+    [0, 1, 0, 0, 0],
+    [0, 0, 2, -2, 1],
+    [1, 0, -2, 0, 2]
+], dtype=float)
+
+def s_Vondrak_IAU2000A_spline_batch(jd0, jd1, out=None, work=None):
+    """
+    Array version of s_Vondrak_IAU2000A_spline(). jd0 and jd1 are broadcast
+    against each other like the arguments of a NumPy ufunc.
+
+    JD must be in the range so that |T| = |(jd-2451545)/36525| <= 60 for all elements.
+
+    s is returned in radians.
+    If out is given, the result is stored in it. If work (a BatchWorkspace)
+    is also given and reused, repeated calls on arrays of a fixed shape
+    allocate no new arrays.
+    """
+    shape = broadcast_shape(jd0, jd1)
+    work = prepare_work(work)
+    jd_int = work.get('s_jd_int', shape)
+    fday = work.get('s_fday', shape)
+    split_jd_batch(jd0, jd1, jd_int, fday, work)
+    return s_Vondrak_IAU2000A_spline_split(jd_int, fday, out, work)
+
+def s_Vondrak_IAU2000A_spline_datetime64(t_tt, out=None, work=None):
+    """
+    Calculate s by the spline formula at the TT times t_tt, given as a
+    datetime64 array or an integer array of nanoseconds since
+    1970-01-01T00:00:00 TT. No time scale conversion is done: the times must
+    already be in TT.
+
+    The Julian date is split into its integer and fractional parts with
+    integer arithmetic, see split_datetime64_batch().
+
+    s is returned in radians, and is NaN where t_tt is NaT.
+    out and work are as in s_Vondrak_IAU2000A_spline_batch().
+    """
+    shape = np.shape(t_tt)
+    work = prepare_work(work)
+    jd_int = work.get('s_jd_int', shape)
+    fday = work.get('s_fday', shape)
+    jd_int, fday, nat = split_datetime64_batch(t_tt, jd_int, fday, work)
+    s = s_Vondrak_IAU2000A_spline_split(jd_int, fday, out, work)
+    return set_nat_to_nan(s, nat)
+
+def s_Vondrak_IAU2000A_spline_split(jd_int, fday, out=None, work=None):
+    """
+    Array version of s_Vondrak_IAU2000A_spline() at TT JD = jd_int + fday,
+    where jd_int is an integer and fday is in [0, 1).
+    """
+    shape = broadcast_shape(jd_int, fday)
+    s = prepare_out(out, shape)
+    work = prepare_work(work)
+    n = s.size
+    nang = len(S_ARG_MULT)
+    T = work.get('s_T', shape)
+    Tp = work.get('s_Tp', shape)
+    np.subtract(jd_int, 2451545, out=T)
+    T += fday
+    T /= 36525.0
+    np.absolute(T, out=s)
+    if n > 0 and s.max() > 60:
+        raise RuntimeError('Requested time is out of range.')
+
+    iseg = spline_segment_batch(T, work.get('s_iseg', shape, np.intp), work)
+    np.take(S_T0, iseg, out=Tp, mode='clip')
+    np.subtract(T, Tp, out=Tp)
+    Tp = Tp.reshape(n)
+
+    # polynomial part
+    cpoly = work.get('s_cpoly', (6, n))
+    np.take(S_TABLES[0], iseg.reshape(n), axis=1, out=cpoly, mode='clip')
+    s1 = work.get('s_sum', (n,))
+    np.multiply(Tp, cpoly[5], out=s1)
+    for i in (4, 3, 2, 1, 0):
+        s1 += cpoly[i]
+        if i > 0: s1 *= Tp
+
+    # periodic part: sum of (c0 + Tp*(c1 + Tp*c2))*cos(angs) + (s0 + Tp*(s1 + Tp*s2))*sin(angs)
+    F = fundamental_arguments_batch(jd_int, fday, work.get('s_F', (5,) + shape), work, n=5)
+    angs = work.get('s_angs', (nang, n))
+    trig = work.get('s_trig', (nang, n))
+    amp = work.get('s_amp', (nang, n))
+    c = work.get('s_c', (nang, n))
+    np.matmul(S_ARG_MULT, F.reshape(5, n), out=angs)
+    for j, trig_func in ((1, np.cos), (4, np.sin)):
+        np.take(S_TABLES[j+2], iseg.reshape(n), axis=1, out=amp, mode='clip')
+        amp *= Tp
+        np.take(S_TABLES[j+1], iseg.reshape(n), axis=1, out=c, mode='clip')
+        amp += c
+        amp *= Tp
+        np.take(S_TABLES[j], iseg.reshape(n), axis=1, out=c, mode='clip')
+        amp += c
+        trig_func(angs, out=trig)
+        amp *= trig
+        np.add.reduce(amp, axis=0, out=c[0])
+        s1 += c[0]
+    np.copyto(s, s1.reshape(shape))
+    return s
@@ -0,0 +1,20 @@
+import numpy as np
+
+# Knots of the spline formulas for Eo and s. Sub-interval i contains T if
+# exactly i of the tests T >= -40, T >= -20, T >= -5, T > 5, T >= 20, T >= 40
+# are true, which reproduces the choice made in set_Eop_coefficients() and
+# set_s_coefficients().
+SPLINE_KNOTS = ((-40, np.greater_equal), (-20, np.greater_equal), (-5, np.greater_equal),
+                (5, np.greater), (20, np.greater_equal), (40, np.greater_equal))
+
+def spline_segment_batch(T, iseg, work):
+    """
+    Store in the integer array iseg the index (0 to 6) of the spline
+    sub-interval containing each element of T.
+    """
+    flag = work.get('spline_flag', T.shape, bool)
+    iseg[...] = 0
+    for knot, compare in SPLINE_KNOTS:
+        compare(T, knot, out=flag)
+        np.add(iseg, flag, out=iseg)
+    return iseg
@@ -0,0 +1,162 @@
+import tracemalloc
+import numpy as np
+import pytest
+
+from batch_workspace import BatchWorkspace
+from Dpsi_cos_epsilonA import Dpsi_cos_epsilonA, Dpsi_cos_epsilonA_batch
+from ERA_GAST import ERA_from_UT1, ERA_from_UT1_batch, ERA_from_UT1_datetime64, GAST_Vondrak_IAU2000A_spline_datetime64
+from Eo_Vondrak_IAU2000A_spline import Eo_Vondrak_IAU2000A_spline, Eo_Vondrak_IAU2000A_spline_batch, Eo_Vondrak_IAU2000A_spline_datetime64
+from s_Vondrak_IAU2000A_spline import s_Vondrak_IAU2000A_spline, s_Vondrak_IAU2000A_spline_batch, s_Vondrak_IAU2000A_spline_datetime64
+from fundamental_arguments import fundamental_arguments, f_angles, fundamental_arguments_batch
+from mod_functions import mod2pi, mod2pi_batch, mod2pi_omgDf, mod2pi_omgDf_batch
+
+def random_jd(n, seed=0):
+    """
+    Two-part TT Julian dates within |T| < 60 (plus the spline knots).
+    """
+    rng = np.random.default_rng(seed)
+    jd0 = 2451545.0 + rng.integers(-2190000, 2190000, n).astype(float) - 0.5
+    jd1 = rng.uniform(0, 1, n)
+    k = min(n, 7)
+    jd0[:k] = 2451545 + np.array([-40, -20, -5, 5, 20, 40, 0])[:k]*36525.0
+    jd1[:k] = 0
+    return jd0, jd1
+
+def random_datetime64(n, seed=0):
+    """
+    datetime64[ns] times covering the whole representable range, with a NaT.
+    """
+    rng = np.random.default_rng(seed)
+    t = rng.integers(-2**63 + 1, 2**63 - 1, n).astype('datetime64[ns]')
+    t[0] = np.datetime64('NaT')
+    return t
+
+def batch_calls(n):
+    """
+    Return (name, function, args, out) for each batch function on arrays of size n.
+    """
+    jd0, jd1 = random_jd(n)
+    jd_int = np.floor(jd0 + jd1)
+    fday = (jd0 + jd1) - jd_int
+    t = random_datetime64(n)
+    return [
+        ('ERA', ERA_from_UT1_batch, (jd0, jd1), np.empty(n)),
+        ('Eo', Eo_Vondrak_IAU2000A_spline_batch, (jd0, jd1), np.empty(n)),
+        ('s', s_Vondrak_IAU2000A_spline_batch, (jd0, jd1), np.empty(n)),
+        ('F', fundamental_arguments_batch, (jd_int, fday), np.empty((14, n))),
+        ('ERA_dt64', ERA_from_UT1_datetime64, (t,), np.empty(n)),
+        ('Eo_dt64', Eo_Vondrak_IAU2000A_spline_datetime64, (t,), np.empty(n)),
+        ('s_dt64', s_Vondrak_IAU2000A_spline_datetime64, (t,), np.empty(n)),
+        ('GAST_dt64', GAST_Vondrak_IAU2000A_spline_datetime64, (t, t + np.timedelta64(69, 's')), np.empty(n)),
+    ]
+
+def traced_memory(f, args, out, work, ncalls, nwarm=20):
+    """
+    Warm up f with the reused out and work, then return (growth, peak): the
+    growth of the traced memory over ncalls calls and the peak traced memory
+    during those calls, both relative to the memory before the calls.
+    """
+    for _ in range(nwarm):
+        f(*args, out=out, work=work)
+    tracemalloc.start()
+    try:
+        for _ in range(nwarm):
+            f(*args, out=out, work=work)
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(ncalls):
+            f(*args, out=out, work=work)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current - before, peak - before
+
+@pytest.mark.parametrize('i', range(8))
+def test_no_allocation_after_warm_up(i):
+    name, f, args, out = batch_calls(1000)[i]
+    growth, peak = traced_memory(f, args, out, BatchWorkspace(), 50)
+    # allow for a few bytes of interpreter bookkeeping, far less than one array
+    assert growth < 1024, name
+
+@pytest.mark.parametrize('i', range(8))
+def test_peak_memory_independent_of_size(i):
+    # Both sizes exceed the 8192 element buffers NumPy uses internally for
+    # casting and broadcasting, whose size is bounded.
+    name, f, args, out = batch_calls(10000)[i]
+    peak_small = traced_memory(f, args, out, BatchWorkspace(), 2, nwarm=1)[1]
+    name, f, args, out = batch_calls(100000)[i]
+    peak_large = traced_memory(f, args, out, BatchWorkspace(), 2, nwarm=1)[1]
+    # a single float64 array of 1e5 elements takes 800 kB
+    assert peak_large < peak_small + 16384, name
+
+def test_batch_agrees_with_scalar():
+    jd0, jd1 = random_jd(300)
+    work = BatchWorkspace()
+    ERA = ERA_from_UT1_batch(jd0, jd1, work=work)
+    Eo = Eo_Vondrak_IAU2000A_spline_batch(jd0, jd1, work=work)
+    s = s_Vondrak_IAU2000A_spline_batch(jd0, jd1, work=work)
+    jd_int = np.floor(jd0 + jd1)
+    fday = (jd0 + jd1) - jd_int
+    F = fundamental_arguments_batch(jd_int, fday, work=work)
+    F5 = fundamental_arguments_batch(jd_int, fday, work=work, n=5)
+    T = ((jd_int - 2451545) + fday)/36525
+    Dpsi = Dpsi_cos_epsilonA_batch(T, F, work=work)
+    for k in range(len(jd0)):
+        assert ERA[k] == ERA_from_UT1(jd0[k], jd1[k])
+        assert abs(Eo[k] - Eo_Vondrak_IAU2000A_spline(jd0[k], jd1[k])) < 1e-15
+        assert abs(s[k] - s_Vondrak_IAU2000A_spline(jd0[k], jd1[k])) < 1e-15
+        assert list(F[:, k]) == fundamental_arguments(jd_int[k], fday[k])
+        assert list(F5[:, k]) == f_angles(jd_int[k], fday[k])
+        assert abs(Dpsi[k] - Dpsi_cos_epsilonA(T[k], list(F[:, k]))) < 1e-18
+
+def test_dpsi_table_matches_scalar():
+    # DPSI_TERMS is a separate copy of the terms in Dpsi_cos_epsilonA(). With
+    # arbitrary arguments, an error in any term (the smallest amplitude is
+    # 1e-11 rad) shows up far above the rounding error.
+    rng = np.random.default_rng(1)
+    T = rng.uniform(-60, 60, 500)
+    F = rng.uniform(-np.pi, np.pi, (14, 500))
+    Dpsi = Dpsi_cos_epsilonA_batch(T, F)
+    for k in range(len(T)):
+        assert abs(Dpsi[k] - Dpsi_cos_epsilonA(T[k], list(F[:, k]))) < 1e-18
+
+def test_broadcasting():
+    jd1 = np.array([[0.1], [0.2]]) + np.zeros(3)
+    Eo = Eo_Vondrak_IAU2000A_spline_batch(2451545.0, np.array([[0.1], [0.2]]))
+    assert Eo.shape == (2, 1)
+    s = s_Vondrak_IAU2000A_spline_batch(2451545.0, jd1)
+    assert s.shape == (2, 3)
+    assert abs(s[1, 2] - s_Vondrak_IAU2000A_spline_batch(2451545.0, 0.2)) < 1e-18
+    assert ERA_from_UT1_batch(2451545.0, 0.1).shape == ()
+
+def test_out_must_be_float64():
+    with pytest.raises(TypeError):
+        ERA_from_UT1_batch(2451545.0, np.zeros(2), out=np.empty(2, np.float32))
+    with pytest.raises(TypeError):
+        fundamental_arguments_batch(2451545.0, np.zeros(2), out=np.empty((14, 2), np.float32))
+    with pytest.raises(ValueError):
+        Eo_Vondrak_IAU2000A_spline_batch(2451545.0, np.zeros(2), out=np.empty(3))
+
+def test_mod2pi_matches_scalar_at_boundaries():
+    # odd multiples of pi and their neighbouring floating point numbers
+    x = np.arange(-2001, 2002, 2)*np.pi
+    x = np.concatenate([np.nextafter(x, -np.inf), x, np.nextafter(x, np.inf)])
+    y = mod2pi_batch(x, np.empty(x.shape), BatchWorkspace())
+    assert list(y) == [mod2pi(v) for v in x]
+    D = np.floor(x*1e4)
+    f = np.linspace(0, 1, len(x))
+    y = mod2pi_omgDf_batch(0.01720217957524373, D, f, np.empty(x.shape), BatchWorkspace())
+    assert list(y) == [mod2pi_omgDf(0.01720217957524373, D[k], f[k]) for k in range(len(x))]
+
+def test_fundamental_arguments_n():
+    for n in (0, 13, 18):
+        with pytest.raises(ValueError):
+            fundamental_arguments_batch(2451545.0, np.zeros(2), n=n)
+
+def test_nan_propagates():
+    ERA = ERA_from_UT1_batch(2451545.0, np.array([np.nan, 0.1]))
+    assert np.isnan(ERA[0]) and ERA[1] == ERA_from_UT1(2451545.0, 0.1)
+
+def test_out_of_range():
+    with pytest.raises(RuntimeError):
+        s_Vondrak_IAU2000A_spline_batch(2451545.0, np.array([0, 61*36525.0]))
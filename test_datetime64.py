@@ -0,0 +1,75 @@
+from fractions import Fraction
+import numpy as np
+import pytest
+
+from batch_workspace import BatchWorkspace
+from datetime64_split import split_datetime64_batch
+from ERA_GAST import ERA_from_UT1, ERA_from_UT1_datetime64, GAST_from_Eo, GAST_Vondrak_IAU2000A_spline_datetime64
+from Eo_Vondrak_IAU2000A_spline import Eo_Vondrak_IAU2000A_spline, Eo_Vondrak_IAU2000A_spline_datetime64
+from s_Vondrak_IAU2000A_spline import s_Vondrak_IAU2000A_spline, s_Vondrak_IAU2000A_spline_datetime64
+from test_batch_alloc import random_datetime64
+
+def test_datetime64_split_is_exact():
+    t = random_datetime64(2000)[1:]
+    jd_int = np.empty(t.shape)
+    fday = np.empty(t.shape)
+    split_datetime64_batch(t, jd_int, fday, BatchWorkspace())
+    for k, ns in enumerate(t.view(np.int64)):
+        # 1970-01-01T00:00:00 is JD 2440587.5
+        jd = Fraction(int(ns), 86400*10**9) + Fraction(4881175, 2)
+        assert jd_int[k] == jd.numerator // jd.denominator
+        assert fday[k] == float(jd - jd.numerator // jd.denominator)
+
+def test_datetime64_units():
+    t = np.array(['2000-01-01T12:00:00', '1969-12-31T12:00:00', '1970-01-01T00:00:00'], 'datetime64[ns]')
+    ERA = ERA_from_UT1_datetime64(t)
+    assert ERA[0] == ERA_from_UT1(2451545.0, 0.0)
+    assert ERA[1] == ERA_from_UT1(2440587.0, 0.0)
+    assert ERA[2] == ERA_from_UT1(2440587.0, 0.5)
+    for unit in ('D', 'h', 's', 'ms', 'us', 'ps', 'M'):
+        tu = t.astype('datetime64[%s]' % unit)
+        assert np.array_equal(ERA_from_UT1_datetime64(tu), ERA_from_UT1_datetime64(tu.astype('datetime64[ns]')))
+    assert np.array_equal(ERA_from_UT1_datetime64(t.view(np.int64)), ERA)
+
+def test_datetime64_agrees_with_scalar():
+    # Seconds resolution reaches the whole range |T| <= 60 of the spline
+    # formulas, far beyond the years 1678-2261 of datetime64[ns].
+    t = np.array(['-3000-01-01T00:00:00', '1500-03-01T06:30:00', '2000-01-01T12:00:00',
+                  '2262-01-01T00:00:00', '7000-06-01T18:45:30'], 'datetime64[s]')
+    sec = t.view(np.int64)
+    # exact two-part JD: 1970-01-01T00:00:00 is JD 2440587.5
+    jd0 = 2440587.5 + sec//86400
+    jd1 = (sec % 86400)/86400
+    ERA = ERA_from_UT1_datetime64(t)
+    Eo = Eo_Vondrak_IAU2000A_spline_datetime64(t)
+    s = s_Vondrak_IAU2000A_spline_datetime64(t)
+    G = GAST_Vondrak_IAU2000A_spline_datetime64(t, t)
+    for k in range(len(t)):
+        assert abs(ERA[k] - ERA_from_UT1(jd0[k], jd1[k])) < 1e-14
+        assert abs(Eo[k] - Eo_Vondrak_IAU2000A_spline(jd0[k], jd1[k])) < 1e-15
+        assert abs(s[k] - s_Vondrak_IAU2000A_spline(jd0[k], jd1[k])) < 1e-15
+        assert abs(G[k] - GAST_from_Eo(jd0[k], jd1[k], Eo_Vondrak_IAU2000A_spline(jd0[k], jd1[k]))) < 1e-14
+
+def test_datetime64_nat():
+    t = np.array(['NaT', '2000-01-01'], 'datetime64[ns]')
+    for f in (ERA_from_UT1_datetime64, Eo_Vondrak_IAU2000A_spline_datetime64, s_Vondrak_IAU2000A_spline_datetime64):
+        x = f(t)
+        assert np.isnan(x[0]) and np.isfinite(x[1])
+        assert np.isnan(f(t.astype('datetime64[D]'))[0])
+    G = GAST_Vondrak_IAU2000A_spline_datetime64(t, t[::-1])
+    assert np.isnan(G).all()
+
+def test_datetime64_rejects_large_uint64():
+    with pytest.raises(ValueError):
+        ERA_from_UT1_datetime64(np.array([2**63], np.uint64))
+    with pytest.raises(TypeError):
+        ERA_from_UT1_datetime64(np.array([1.5]))
+
+def test_gast_datetime64_broadcasting():
+    t = np.array(['2000-01-01', '2010-05-01'], 'datetime64[ns]')
+    dt = np.timedelta64(64, 's')
+    G = GAST_Vondrak_IAU2000A_spline_datetime64(t[:, None], t + dt)
+    assert G.shape == (2, 2)
+    assert G[1, 0] == GAST_Vondrak_IAU2000A_spline_datetime64(t[1], t[0] + dt)
+    with pytest.raises(ValueError, match='broadcast'):
+        GAST_Vondrak_IAU2000A_spline_datetime64(t, np.concatenate([t, t, t]))